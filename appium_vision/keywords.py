@@ -1,18 +1,29 @@
 from appium import webdriver
 from robot.api.deco import keyword
 from appium.options.android import UiAutomator2Options
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
 from robot.api import logger
 from robot.libraries.BuiltIn import BuiltIn
-from datetime import datetime
+import base64
+import shlex
 import subprocess
 import configparser
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
-import cv2
 import shutil
 import importlib.util
-import pytesseract
+
+# cv2, numpy and pytesseract are imported inside the keywords that need
+# them: Robot Framework imports libraries at parse time, and suites that
+# never touch OCR/image keywords shouldn't pay their import cost.
+
+# Tesseract's OpenMP threading adds coordination overhead that makes
+# single-image OCR calls slower; pin it to one thread unless overridden.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 
 class AppiumKeywords:
@@ -29,6 +40,11 @@ class AppiumKeywords:
     - Screen recording with embedded video reporting
     """
 
+    # Class-level cache of the parsed configurations.ini: (path, mtime, config)
+    _config_cache = None
+
+    APPIUM_URL = "http://127.0.0.1:4723"
+
     def __init__(self):
         """
         Initializes keyword library.
@@ -36,17 +52,30 @@ class AppiumKeywords:
         - Initializes driver dictionary
         """
         self.drivers = {}
-
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        ini_path = os.path.join(base_path, "..", "Configurations", "configurations.ini")
-
-        self.config = configparser.ConfigParser()
-        self.config.read(ini_path)
-
-        # Optional Tesseract override (recommended for PyPI users)
-        tesseract_cmd = os.getenv("TESSERACT_CMD")
-        if tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        self._driver_lock = threading.Lock()
+        self._http_executor = None
+        self._ref_cache = {}
+        self._pyr_cache = {}
+        self._coord_cache = {}
+        self._last_match = {}
+        self._win_cache = {}
+        self._debug = os.getenv("APPIUM_VISION_DEBUG", "").lower() in ("1", "true")
+
+        self.config = self._get_config()
+
+        # Plain-dict snapshot of the DUT sections; avoids ConfigParser's
+        # case-folding lookup on every keyword call and hands
+        # load_capabilities a cheap dict to iterate
+        self._dut_caps = {s: dict(self.config.items(s)) for s in self.config.sections()}
+
+        # Optional Tesseract override (recommended for PyPI users);
+        # applied when the pytesseract backend is first used
+        self._tesseract_cmd = os.getenv("TESSERACT_CMD")
+
+        # OCR backend is resolved on first use so suites that never OCR
+        # don't pay for the tesserocr/pytesseract imports
+        self._tess_api = None
+        self._ocr_backend = None
         
         # Runtime dependency validation
         try:
@@ -56,6 +85,363 @@ class AppiumKeywords:
                 f"⚠️ Dependency check skipped during initialization:\n{e}"
             )
 
+    # ---------------------------------------------------------------------
+    @classmethod
+    def _get_config(cls):
+        """
+        Returns the parsed configurations.ini, cached at class level.
+
+        Robot Framework may instantiate the library several times per
+        suite; the INI is only re-read when its mtime changes.
+        """
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        ini_path = os.path.join(base_path, "..", "Configurations", "configurations.ini")
+
+        try:
+            mtime = os.path.getmtime(ini_path)
+        except OSError:
+            mtime = None
+
+        if cls._config_cache is not None:
+            cached_path, cached_mtime, config = cls._config_cache
+            if cached_path == ini_path and cached_mtime == mtime:
+                return config
+
+        config = configparser.ConfigParser()
+        config.read(ini_path)
+        cls._config_cache = (ini_path, mtime, config)
+        return config
+
+    # ---------------------------------------------------------------------
+    def _load_coords(self, json_file):
+        """
+        Returns {key: (x, y)} for a coordinates JSON, cached by mtime.
+
+        The file is parsed and every entry pre-resolved to int pairs
+        once; repeated taps reuse the snapshot until the file changes.
+        """
+        try:
+            mtime = os.path.getmtime(json_file)
+        except OSError:
+            raise AssertionError(f"JSON file not found: {json_file}")
+
+        cached = self._coord_cache.get(json_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(json_file) as f:
+            data = json.load(f)
+
+        coords = {k: (int(v["x"]), int(v["y"])) for k, v in data.items()}
+        self._coord_cache[json_file] = (mtime, coords)
+        return coords
+
+    # ---------------------------------------------------------------------
+    def _window_size(self, dut_name):
+        """
+        Returns the DUT's window size, fetched once per session.
+
+        The size never changes while a session is alive, so caching it
+        saves one Appium HTTP round trip per gesture.
+        """
+        size = self._win_cache.get(dut_name)
+        if size is None:
+            size = self.start_appium_session(dut_name).get_window_size()
+            self._win_cache[dut_name] = size
+        return size
+
+    # ---------------------------------------------------------------------
+    def _get_tess_api(self):
+        """
+        Resolves the OCR backend on first use.
+
+        Prefers tesserocr when available: one persistent in-process API
+        instead of a tesseract subprocess (and model reload) per call.
+
+        Returns:
+        - The tesserocr API instance, or None for the pytesseract fallback
+        """
+        if self._ocr_backend is None:
+            try:
+                import tesserocr
+                self._tess_api = tesserocr.PyTessBaseAPI()
+                self._ocr_backend = "tesserocr"
+            except ImportError:
+                self._ocr_backend = "pytesseract"
+        return self._tess_api
+
+    # ---------------------------------------------------------------------
+    def _pytesseract(self):
+        """Imports pytesseract and applies the TESSERACT_CMD override once."""
+        import pytesseract
+        if self._tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = self._tesseract_cmd
+            self._tesseract_cmd = None
+        return pytesseract
+
+    # ---------------------------------------------------------------------
+    def _find_word(self, gray, expected_text):
+        """
+        Locates a word in a grayscale screenshot via OCR.
+
+        Uses the persistent tesserocr API when installed (no subprocess or
+        language-model reload per call), otherwise falls back to
+        pytesseract.image_to_data.
+
+        Returns:
+        - (x, y, w, h) of the matched word, or None
+        """
+        api = self._get_tess_api()
+        if api is not None:
+            from PIL import Image
+            from tesserocr import RIL
+
+            api.SetImage(Image.fromarray(gray))
+            for _, box, _, _ in api.GetComponentImages(RIL.WORD, True):
+                api.SetRectangle(box["x"], box["y"], box["w"], box["h"])
+                if api.GetUTF8Text().strip() == expected_text:
+                    return box["x"], box["y"], box["w"], box["h"]
+            return None
+
+        import numpy as np
+
+        pytesseract = self._pytesseract()
+        ocr_data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT)
+        texts = np.asarray(ocr_data["text"], dtype=str)
+        idx = np.flatnonzero(np.char.strip(texts) == expected_text)
+        if idx.size:
+            i = int(idx[0])
+            return (
+                ocr_data["left"][i],
+                ocr_data["top"][i],
+                ocr_data["width"][i],
+                ocr_data["height"][i],
+            )
+        return None
+
+    # ---------------------------------------------------------------------
+    def _adb_screencap(self, device_id, gray=False):
+        """
+        Captures the screen via `adb exec-out screencap` as a raw buffer.
+
+        Without -p, screencap emits raw RGBA pixels behind a small header
+        (width, height, format as little-endian uint32), so there is no
+        PNG encode on the device and no decode on the host.
+
+        Returns:
+        - ndarray, or None if the capture could not be parsed
+        """
+        import cv2
+        import numpy as np
+
+        proc = subprocess.run(
+            ["adb", "-s", device_id, "exec-out", "screencap"],
+            capture_output=True
+        )
+        raw = proc.stdout
+        if proc.returncode != 0 or len(raw) < 16:
+            return None
+
+        w, h = np.frombuffer(raw[:8], np.uint32)
+
+        # Header is 12 bytes up to Android 8, 16 (extra colorspace) after
+        for offset in (16, 12):
+            if len(raw) - offset == w * h * 4:
+                img = np.frombuffer(raw[offset:], np.uint8).reshape(int(h), int(w), 4)
+                return cv2.cvtColor(img, cv2.COLOR_RGBA2GRAY if gray else cv2.COLOR_RGBA2BGR)
+        return None
+
+    # ---------------------------------------------------------------------
+    def _grab_screen(self, driver, dut_name=None, gray=False):
+        """
+        Captures the current screen as an ndarray without touching disk.
+
+        Prefers the raw adb screencap stream when the DUT's device_id is
+        known; otherwise streams the PNG bytes over the Appium session
+        and decodes them in memory.
+        """
+        import cv2
+        import numpy as np
+
+        if dut_name is not None:
+            device_id = self.get_device_id(dut_name).get("device_id")
+            if device_id:
+                try:
+                    img = self._adb_screencap(device_id, gray=gray)
+                except (OSError, subprocess.SubprocessError):
+                    img = None
+                if img is not None:
+                    return img
+
+        buf = np.frombuffer(driver.get_screenshot_as_png(), np.uint8)
+        return cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE if gray else cv2.IMREAD_COLOR)
+
+    # ---------------------------------------------------------------------
+    def _dump_debug(self, prefix, screen):
+        """
+        Writes a debug copy of a captured screen when debug mode is on.
+
+        JPEG at quality 70 rather than PNG: encode is several times
+        faster and the artifact is only for visual inspection.
+        """
+        if not self._debug:
+            return
+
+        import cv2
+
+        output_dir = BuiltIn().get_variable_value("${OUTPUTDIR}")
+        cv2.imwrite(
+            os.path.join(output_dir, f"{prefix}_{time.time()}.jpg"),
+            screen,
+            [cv2.IMWRITE_JPEG_QUALITY, 70]
+        )
+
+    # ---------------------------------------------------------------------
+    def _load_ref_gray(self, image_name):
+        """
+        Returns cached (gray ndarray, (height, width), mask) for a reference image.
+
+        Reads the image from Resources/images only on first use; repeated
+        calls for the same image reuse the in-memory grayscale copy. For
+        4-channel PNGs the alpha channel becomes a match mask so the
+        transparent border pixels of icon templates are skipped.
+        """
+        cached = self._ref_cache.get(image_name)
+        if cached is not None:
+            return cached
+
+        import cv2
+        import numpy as np
+
+        project_root = BuiltIn().get_variable_value("${EXECDIR}")
+        ref_path = os.path.join(project_root, "Resources", "images", image_name)
+
+        ref = cv2.imread(ref_path, cv2.IMREAD_UNCHANGED)
+        if ref is None:
+            raise AssertionError(f"Reference image not found: {ref_path}")
+
+        mask = None
+        if ref.ndim == 3 and ref.shape[2] == 4:
+            mask = ref[:, :, 3]
+            if not np.any(mask < 255):
+                mask = None  # fully opaque alpha carries no information
+            gray = cv2.cvtColor(ref, cv2.COLOR_BGRA2GRAY)
+        elif ref.ndim == 3:
+            gray = cv2.cvtColor(ref, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = ref
+
+        self._ref_cache[image_name] = (gray, gray.shape[:2], mask)
+        return self._ref_cache[image_name]
+
+    # ---------------------------------------------------------------------
+    def _ref_pyramid(self, image_name, ref_gray):
+        """Returns the cached [full, half, quarter] pyramid of a template."""
+        import cv2
+
+        pyr = self._pyr_cache.get(image_name)
+        if pyr is None:
+            half = cv2.pyrDown(ref_gray)
+            pyr = [ref_gray, half, cv2.pyrDown(half)]
+            self._pyr_cache[image_name] = pyr
+        return pyr
+
+    # ---------------------------------------------------------------------
+    def _pyramid_locate(self, screen, pyr, method, pad=8):
+        """
+        Coarse-to-fine template matching over an image pyramid.
+
+        Matches at the quarter-scale level first, then refines the best
+        location in a small window at each finer level, so only a
+        fraction of the full-resolution comparisons are performed.
+
+        Returns:
+        - (score, (x, y)) at full scale, or None if refinement ran off
+          the frame
+        """
+        import cv2
+
+        screens = [screen]
+        for _ in range(len(pyr) - 1):
+            screens.append(cv2.pyrDown(screens[-1]))
+
+        res = cv2.matchTemplate(screens[-1], pyr[-1], method)
+        _, val, _, loc = cv2.minMaxLoc(res)
+
+        for level in range(len(pyr) - 2, -1, -1):
+            th, tw = pyr[level].shape[:2]
+            x0 = max(loc[0] * 2 - pad, 0)
+            y0 = max(loc[1] * 2 - pad, 0)
+            crop = screens[level][y0:y0 + th + 2 * pad, x0:x0 + tw + 2 * pad]
+            if crop.shape[0] < th or crop.shape[1] < tw:
+                return None
+            res = cv2.matchTemplate(crop, pyr[level], method)
+            _, val, _, wloc = cv2.minMaxLoc(res)
+            loc = (wloc[0] + x0, wloc[1] + y0)
+
+        return val, loc
+
+    # ---------------------------------------------------------------------
+    def _locate(self, image_name, screen, ref_gray, threshold, roi=None, pad=100, mask=None):
+        """
+        Runs template matching with a restricted search window when possible.
+
+        Tries an explicit roi first if given, otherwise a padded window
+        around the last successful match for this image; falls back to the
+        full frame on a miss. Successful locations are remembered per
+        image name so repeated lookups stay cheap. With a mask (alpha
+        channel of the template) matching uses TM_CCORR_NORMED, the
+        maximizing method OpenCV supports with masks.
+
+        Returns:
+        - (score, (x, y)) with x,y in full-frame coordinates
+        """
+        import cv2
+        import numpy as np
+
+        th, tw = ref_gray.shape[:2]
+        method = cv2.TM_CCOEFF_NORMED if mask is None else cv2.TM_CCORR_NORMED
+
+        window = roi
+        if window is None:
+            last = self._last_match.get(image_name)
+            if last is not None:
+                window = (last[0] - pad, last[1] - pad, tw + 2 * pad, th + 2 * pad)
+
+        if window is not None:
+            x0 = max(int(window[0]), 0)
+            y0 = max(int(window[1]), 0)
+            crop = screen[y0:y0 + int(window[3]), x0:x0 + int(window[2])]
+            if crop.shape[0] >= th and crop.shape[1] >= tw:
+                res = cv2.matchTemplate(crop, ref_gray, method, mask=mask)
+                if mask is not None:
+                    # Masked TM_CCORR_NORMED yields inf/NaN wherever the
+                    # denominator is zero (all-black regions); minMaxLoc
+                    # would report those as the best match
+                    res[~np.isfinite(res)] = -1
+                _, max_val, _, max_loc = cv2.minMaxLoc(res)
+                if max_val >= threshold or roi is not None:
+                    loc = (max_loc[0] + x0, max_loc[1] + y0)
+                    if max_val >= threshold:
+                        self._last_match[image_name] = loc
+                    return max_val, loc
+
+        # Coarse-to-fine pyramid pass before the exhaustive full-frame
+        # scan; needs a flat (unmasked) template that survives two halvings
+        if mask is None and min(th, tw) >= 32:
+            found = self._pyramid_locate(screen, self._ref_pyramid(image_name, ref_gray), method)
+            if found is not None and found[0] >= threshold:
+                self._last_match[image_name] = found[1]
+                return found
+
+        res = cv2.matchTemplate(screen, ref_gray, method, mask=mask)
+        if mask is not None:
+            res[~np.isfinite(res)] = -1
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        if max_val >= threshold:
+            self._last_match[image_name] = max_loc
+        return max_val, max_loc
+
     # ---------------------------------------------------------------------
     @keyword
     def get_device_id(self, dut_name):
@@ -72,9 +458,10 @@ class AppiumKeywords:
         - DUT section is not found
         """
         section = f"DUT.{dut_name}"
-        if section not in self.config:
+        caps = self._dut_caps.get(section)
+        if caps is None:
             raise Exception(f"DUT section '{section}' not found")
-        return self.config[section]
+        return caps
 
     # ---------------------------------------------------------------------
     @keyword
@@ -93,16 +480,80 @@ class AppiumKeywords:
         if dut_name in self.drivers:
             return self.drivers[dut_name]
 
+        driver = self._create_driver(dut_name)
+
+        with self._driver_lock:
+            self.drivers[dut_name] = driver
+        return driver
+
+    # ---------------------------------------------------------------------
+    def _command_executor(self):
+        """
+        Returns a shared keep-alive AppiumConnection for all sessions.
+
+        Selenium's default is one fresh connection pool of size 1 per
+        driver, which serializes concurrent calls from parallel DUTs;
+        one pool sized for several devices removes that contention.
+        """
+        if self._http_executor is None:
+            from appium.webdriver.appium_connection import AppiumConnection
+
+            try:
+                from selenium.webdriver.remote.client_config import ClientConfig
+                self._http_executor = AppiumConnection(
+                    client_config=ClientConfig(
+                        remote_server_addr=self.APPIUM_URL,
+                        keep_alive=True,
+                        timeout=60,
+                        init_args_for_pool_manager={
+                            "init_args_for_pool_manager": {"num_pools": 16, "maxsize": 16}
+                        },
+                    )
+                )
+            except (ImportError, TypeError):
+                # Older selenium without ClientConfig pool tuning
+                self._http_executor = AppiumConnection(self.APPIUM_URL, keep_alive=True)
+
+        return self._http_executor
+
+    # ---------------------------------------------------------------------
+    def _create_driver(self, dut_name):
+        """Creates a new Appium driver for the given DUT."""
         caps = self.get_device_id(dut_name)
         options = UiAutomator2Options().load_capabilities(caps)
 
-        driver = webdriver.Remote(
-            command_executor="http://127.0.0.1:4723",
+        return webdriver.Remote(
+            command_executor=self._command_executor(),
             options=options
         )
 
-        self.drivers[dut_name] = driver
-        return driver
+    # ---------------------------------------------------------------------
+    @keyword
+    def start_sessions(self, *dut_names):
+        """
+        Starts Appium sessions for multiple DUTs concurrently.
+
+        Session creation is a blocking HTTP round-trip per DUT, so the
+        drivers are created in parallel and total setup time drops from
+        the sum of the individual startups to the slowest one.
+
+        Arguments:
+        - dut_names: Logical DUT names
+
+        Returns:
+        - List of Appium WebDriver instances, in argument order
+        """
+        pending = [d for d in dut_names if d not in self.drivers]
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                futures = {name: pool.submit(self._create_driver, name) for name in pending}
+                for name, future in futures.items():
+                    driver = future.result()
+                    with self._driver_lock:
+                        self.drivers[name] = driver
+
+        return [self.drivers[d] for d in dut_names]
 
     # ---------------------------------------------------------------------
     @keyword
@@ -113,6 +564,14 @@ class AppiumKeywords:
         for driver in self.drivers.values():
             driver.quit()
         self.drivers.clear()
+        self._win_cache.clear()
+
+        if self._tess_api is not None:
+            self._tess_api.End()
+            self._tess_api = None
+            # Let _get_tess_api rebuild the persistent API on the next
+            # OCR call instead of silently falling back to pytesseract
+            self._ocr_backend = None
 
     # ---------------------------------------------------------------------
     @keyword
@@ -132,18 +591,19 @@ class AppiumKeywords:
         """
         driver = self.start_appium_session(dut_name)
 
-        elements = driver.find_elements(
-            by="xpath",
-            value="//*[normalize-space(@text) != '']"
-        )
-
-        visible_texts = [el.text.strip() for el in elements if el.text.strip()]
-
-        if expected_text in visible_texts:
-            logger.info(f"<b style='color:green'>Text verified:</b> {expected_text}", html=True)
-            return True
+        # Native UiSelector matching runs on the device; XPath forces the
+        # driver to serialize and walk the whole view hierarchy
+        escaped = expected_text.replace('"', '\\"')
+        try:
+            driver.find_element(
+                by=AppiumBy.ANDROID_UIAUTOMATOR,
+                value=f'new UiSelector().text("{escaped}")'
+            )
+        except NoSuchElementException:
+            raise AssertionError(f"Exact text '{expected_text}' not found")
 
-        raise AssertionError(f"Exact text '{expected_text}' not found")
+        logger.info(f"<b style='color:green'>Text verified:</b> {expected_text}", html=True)
+        return True
 
     # ---------------------------------------------------------------------
     @keyword
@@ -163,17 +623,12 @@ class AppiumKeywords:
         project_root = BuiltIn().get_variable_value("${EXECDIR}")
 
         json_file = os.path.join(project_root, "Resources", "Coordinates", json_name)
-        if not os.path.isfile(json_file):
-            raise AssertionError(f"JSON file not found: {json_file}")
+        coords = self._load_coords(json_file)
 
-        with open(json_file) as f:
-            data = json.load(f)
-
-        if key_name not in data:
+        if key_name not in coords:
             raise AssertionError(f"Key '{key_name}' not found")
 
-        x = int(data[key_name]["x"])
-        y = int(data[key_name]["y"])
+        x, y = coords[key_name]
 
         driver.execute_script("mobile: clickGesture", {"x": x, "y": y})
         return f"Tapped at ({x},{y}) on {dut_name}"
@@ -195,32 +650,31 @@ class AppiumKeywords:
         - Text not found via OCR
         """
         driver = self.start_appium_session(dut_name)
-        output_dir = BuiltIn().get_variable_value("${OUTPUTDIR}")
-        screenshot_path = os.path.join(output_dir, "ocr_screen.png")
-
-        driver.save_screenshot(screenshot_path)
-        img = cv2.imread(screenshot_path)
 
-        ocr_data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
-
-        for i, text in enumerate(ocr_data["text"]):
-            if text.strip() == expected_text:
-                x = ocr_data["left"][i]
-                y = ocr_data["top"][i]
-                w = ocr_data["width"][i]
-                h = ocr_data["height"][i]
-
-                driver.execute_script(
-                    "mobile: clickGesture",
-                    {"x": int(x + w / 2), "y": int(y + h / 2)}
-                )
-                return True
+        gray = self._grab_screen(driver, dut_name, gray=True)
+        self._dump_debug("ocr_screen", gray)
+
+        # OCR runtime scales with pixel count; downscale large screens so
+        # the longest side is <= 1280 px and map matches back afterwards
+        scale = min(1.0, 1280 / max(gray.shape[:2]))
+        if scale < 1.0:
+            import cv2
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        match = self._find_word(gray, expected_text)
+        if match is not None:
+            x, y, w, h = (v / scale for v in match)
+            driver.execute_script(
+                "mobile: clickGesture",
+                {"x": int(x + w / 2), "y": int(y + h / 2)}
+            )
+            return True
 
         raise AssertionError(f"Text '{expected_text}' not found via OCR")
 
     # ---------------------------------------------------------------------
     @keyword
-    def verify_image_element(self, image_name, dut_name, threshold=0.9):
+    def verify_image_element(self, image_name, dut_name, threshold=0.9, roi=None):
         """
         Verifies an image on screen using OpenCV template matching.
 
@@ -228,26 +682,18 @@ class AppiumKeywords:
         - image_name (str): Reference image
         - dut_name (str): Logical DUT name
         - threshold (float): Similarity threshold
+        - roi (tuple): Optional (x, y, w, h) region to restrict the search
 
         Returns:
         - True if image is matched
         """
         driver = self.start_appium_session(dut_name)
-        project_root = BuiltIn().get_variable_value("${EXECDIR}")
-        output_dir = BuiltIn().get_variable_value("${OUTPUTDIR}")
-
-        ref_img = cv2.imread(os.path.join(project_root, "Resources", "images", image_name))
-        screenshot_path = os.path.join(output_dir, f"verify_{time.time()}.png")
-        driver.save_screenshot(screenshot_path)
 
-        screen = cv2.imread(screenshot_path)
-        res = cv2.matchTemplate(
-            cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY),
-            cv2.cvtColor(ref_img, cv2.COLOR_BGR2GRAY),
-            cv2.TM_CCOEFF_NORMED
-        )
+        ref_gray, _, mask = self._load_ref_gray(image_name)
+        screen = self._grab_screen(driver, dut_name, gray=True)
+        self._dump_debug("verify", screen)
 
-        _, max_val, _, _ = cv2.minMaxLoc(res)
+        max_val, _ = self._locate(image_name, screen, ref_gray, threshold, roi, mask=mask)
         if max_val >= threshold:
             return True
 
@@ -255,7 +701,7 @@ class AppiumKeywords:
 
     # ---------------------------------------------------------------------
     @keyword
-    def click_by_image(self, image_name, dut_name, threshold=0.8):
+    def click_by_image(self, image_name, dut_name, threshold=0.8, roi=None):
         """
         Clicks on UI element using image recognition.
 
@@ -263,30 +709,21 @@ class AppiumKeywords:
         - image_name (str): Reference image
         - dut_name (str): Logical DUT name
         - threshold (float): Confidence threshold
+        - roi (tuple): Optional (x, y, w, h) region to restrict the search
 
         Returns:
         - Click success message
         """
         driver = self.start_appium_session(dut_name)
-        project_root = BuiltIn().get_variable_value("${EXECDIR}")
-        output_dir = BuiltIn().get_variable_value("${OUTPUTDIR}")
-
-        ref = cv2.imread(os.path.join(project_root, "Resources", "images", image_name))
-        screenshot = os.path.join(output_dir, f"click_{time.time()}.png")
-        driver.save_screenshot(screenshot)
 
-        screen = cv2.imread(screenshot)
-        res = cv2.matchTemplate(
-            cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY),
-            cv2.cvtColor(ref, cv2.COLOR_BGR2GRAY),
-            cv2.TM_CCOEFF_NORMED
-        )
+        ref_gray, (h, w), mask = self._load_ref_gray(image_name)
+        screen = self._grab_screen(driver, dut_name, gray=True)
+        self._dump_debug("click", screen)
 
-        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        max_val, max_loc = self._locate(image_name, screen, ref_gray, threshold, roi, mask=mask)
         if max_val < threshold:
             raise AssertionError("Image not found")
 
-        h, w = ref.shape[:2]
         x = max_loc[0] + w // 2
         y = max_loc[1] + h // 2
 
@@ -308,7 +745,7 @@ class AppiumKeywords:
         - Command output
         """
         driver = self.start_appium_session(dut_name)
-        parts = command.split()
+        parts = shlex.split(command)
 
         result = driver.execute_script(
             "mobile: shell",
@@ -319,6 +756,38 @@ class AppiumKeywords:
             return result.get("stdout", "").strip()
         return result.strip()
 
+    # ---------------------------------------------------------------------
+    @keyword
+    def run_commands(self, commands, dut_name, timeout_ms=30000):
+        """
+        Executes multiple Android shell commands in one round trip.
+
+        The commands are joined with && and a separator echo, so a
+        single mobile: shell call replaces N sequential round trips.
+
+        Arguments:
+        - commands (list): Shell command strings
+        - dut_name (str): Logical DUT name
+        - timeout_ms (int): Timeout for the combined call
+
+        Returns:
+        - List of stdout strings, one per command
+        """
+        driver = self.start_appium_session(dut_name)
+        sep = "---SEP---"
+
+        result = driver.execute_script(
+            "mobile: shell",
+            {
+                "command": "sh",
+                "args": ["-c", f" && echo {sep} && ".join(commands)],
+                "timeout": timeout_ms,
+            }
+        )
+
+        stdout = result.get("stdout", "") if isinstance(result, dict) else result
+        return [part.strip() for part in stdout.split(sep)]
+
     # ---------------------------------------------------------------------
     @keyword
     def press_key(self, keycode, dut_name):
@@ -347,7 +816,7 @@ class AppiumKeywords:
         - percent (float): Swipe distance
         """
         driver = self.start_appium_session(dut_name)
-        size = driver.get_window_size()
+        size = self._window_size(dut_name)
 
         driver.execute_script(
             "mobile: scrollGesture",
@@ -373,7 +842,7 @@ class AppiumKeywords:
         - percent (float): Scroll distance
         """
         driver = self.start_appium_session(dut_name)
-        size = driver.get_window_size()
+        size = self._window_size(dut_name)
 
         driver.execute_script(
             "mobile: scrollGesture",
@@ -391,34 +860,28 @@ class AppiumKeywords:
     @keyword
     def start_screen_recording(self, dut_name, test_name):
         """
-        Starts Android screen recording using adb.
+        Starts screen recording through the Appium session.
+
+        Uses mobile: startScreenRecording instead of an adb screenrecord
+        subprocess, so no device-side file has to be pulled afterwards
+        and the bitrate/resolution keep the transfer small.
 
         Arguments:
         - dut_name (str): Logical DUT name
         - test_name (str): Test case name
-
-        Returns:
-        - Device video path
         """
-        device_id = self.get_device_id(dut_name).get("device_id")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = f"/sdcard/{device_id}_{timestamp}_{test_name}.mp4"
-
-        self._screen_proc = subprocess.Popen(
-            ["adb", "-s", device_id, "shell", "screenrecord", path],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-
-        self._device_video_path = path
-        self._device_id = device_id
-        return path
+        driver = self.start_appium_session(dut_name)
+        driver.start_recording_screen(videoSize="720x1280", bitRate=2000000, timeLimit=600)
+        logger.info(f"Screen recording started for {test_name} on {dut_name}")
 
     # ---------------------------------------------------------------------
     @keyword
     def stop_screen_recording(self, dut_name, local_video_path):
         """
-        Stops screen recording and pulls video to local system.
+        Stops screen recording and saves the video locally.
+
+        The MP4 comes back base64-encoded over the session, so there is
+        no separate adb pull round trip.
 
         Arguments:
         - dut_name (str): Logical DUT name
@@ -427,14 +890,11 @@ class AppiumKeywords:
         Returns:
         - Local video path
         """
-        if self._screen_proc:
-            self._screen_proc.terminate()
-            self._screen_proc.wait()
+        driver = self.start_appium_session(dut_name)
+        data = driver.stop_recording_screen()
 
-        subprocess.run(
-            ["adb", "-s", self._device_id, "pull", self._device_video_path, local_video_path],
-            check=True
-        )
+        with open(local_video_path, "wb") as f:
+            f.write(base64.b64decode(data))
         return local_video_path
 
     # ---------------------------------------------------------------------
@@ -469,6 +929,7 @@ def _check_runtime_dependencies(self):
     - Verifies optional system tools (adb, tesseract)
     - Logs warnings instead of crashing where possible
     """
+    import pytesseract
 
     # -------------------------------
     # Required Python packages